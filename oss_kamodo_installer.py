@@ -8,54 +8,170 @@ installation, Kamodo setup, and Jupyter kernel configuration.
 Features:
 - Reads configuration from `oss_kamodo_installer_settings.json`.
 - Provides a `--clean` option to delete the environment.
+- Provides `--offline` (use only the local package cache, no repodata download) and
+  `--frozen` (update an existing environment without resolving dependencies; ignored
+  when the environment is created) options for re-installing an already solved environment.
 - Logs actions and errors to a timestamped file in the `logs/` directory.
 
 Usage:
 - To set up the environment: `python oss_kamodo_installer.py`
 - To remove the environment: `python oss_kamodo_installer.py --clean`
+- To re-install from a warm package cache: `python oss_kamodo_installer.py --offline`
 """
+import argparse
+import atexit
+import codecs
+import functools
 import json
 import os
 import subprocess
 import sys
 import shutil
+import stat
 import logging
+import logging.handlers
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
+# Use the faster orjson parser for the settings file when it is available.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so both are handled alike.
+try:
+    import orjson as settings_parser
+except ImportError:
+    settings_parser = json
+
 # Configure Logging
 # Ensure the 'logs/' directory exists
 LOG_DIR = 'logs'
-if not os.path.exists(LOG_DIR):
-    os.makedirs(LOG_DIR)
+os.makedirs(LOG_DIR, exist_ok=True)
 
 # Generate log filename with date and time
 current_time = datetime.now().strftime('%Y%m%d_%H%M%S')
 log_filename = os.path.join(LOG_DIR, f'oss_kamodo_installer_{current_time}.log')
 
-# Configure the logger
-logging.basicConfig(
-    level=logging.INFO,  # Default logging level
-    format='%(asctime)s - %(levelname)s - %(message)s',  # Log message format
-    filename=log_filename,  # File to store logs
-    filemode='a'  # Append to the log file
-)
-
-# Add a console handler for real-time output
-console_handler = logging.StreamHandler()
-console_handler.setLevel(logging.INFO)
-console_formatter = logging.Formatter('%(levelname)s - %(message)s')
-console_handler.setFormatter(console_formatter)
-logging.getLogger().addHandler(console_handler)
-
-# Log the initialization message as the first line in the log
-INITIAL_MESSAGE = f"Log file created: {log_filename}"
-logging.info(INITIAL_MESSAGE)
+# Skip the thread and process lookups done for every log record; the formats do not use them
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# Configure the logger and add a console handler for real-time output. The root logger is
+# only configured once, so re-importing the module (e.g. under `python -m`) does not add
+# duplicate handlers.
+if not logging.getLogger().handlers:
+    logging.getLogger().setLevel(logging.INFO)  # Default logging level
+
+    # The log file is opened on the first write, and records are buffered and written in
+    # batches of 1024 (or immediately on an error) instead of one write per record
+    file_handler = logging.FileHandler(log_filename, mode='a', delay=True)
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        capacity=1024, flushLevel=logging.ERROR, target=file_handler)
+    logging.getLogger().addHandler(buffered_file_handler)
+    atexit.register(buffered_file_handler.flush)
+
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.INFO)
+    console_formatter = logging.Formatter('%(levelname)s - %(message)s')
+    console_handler.setFormatter(console_formatter)
+    logging.getLogger().addHandler(console_handler)
+
+    # Log the initialization message as the first line in the log
+    INITIAL_MESSAGE = f"Log file created: {log_filename}"
+    logging.info(INITIAL_MESSAGE)
+
+# Executables resolved once at import time; None if not found in PATH.
+# Micromamba is the preferred package manager since it is a single static binary without
+# Python startup cost; Mamba is the fallback.
+MGR = shutil.which("micromamba") or shutil.which("mamba")
+GIT = shutil.which("git")
+JUPYTER = shutil.which("jupyter")
+
+# Environment passed to every subprocess: parallel package downloads, the libmamba solver,
+# and no Mamba banner
+SUBENV = {
+    **os.environ,
+    "CONDA_FETCH_THREADS": str(os.cpu_count() or 4),
+    "CONDA_SOLVER": "libmamba",
+    "MAMBA_NO_BANNER": "1"
+}
+
+def log_output(output):
+    """Logs a block of command output as one record, skipping blank output."""
+    output = output.strip('\r\n')
+    if output:
+        logging.info(output)
+
+def run_command(cmd):
+    """
+    Runs a command with SUBENV and writes its combined stdout/stderr to the log in chunks.
+
+    Each chunk is logged up to its last complete line; a partial trailing line (or a split
+    multi-byte character) is kept and logged with the next chunk.
+    Raises `subprocess.CalledProcessError` on a non-zero exit code, like `subprocess.check_call`.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    pending = ''
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                          bufsize=65536, env=SUBENV) as process:
+        for chunk in iter(lambda: process.stdout.read1(65536), b''):
+            lines, _, pending = (pending + decoder.decode(chunk)).rpartition('\n')
+            log_output(lines)
+        log_output(pending + decoder.decode(b'', final=True))
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, cmd)
+
+# Parsed settings file contents (before defaults are applied), keyed by the settings file's
+# path, mtime and size. Defaults are applied on every run, so changing them needs no
+# cache invalidation.
+SETTINGS_CACHE_FILE = os.path.join(LOG_DIR, '.settings.cache.json')
+
+def load_cached_settings(cache_key):
+    """Returns the cached settings if they were stored under the given key, otherwise None."""
+    try:
+        with open(SETTINGS_CACHE_FILE, 'rb') as file:
+            cache = settings_parser.loads(file.read())
+        stored_key, settings = cache["key"], cache["settings"]
+    except FileNotFoundError:
+        return None
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        # Any corrupt or unexpected cache content falls back to parsing the settings file
+        logging.warning("Ignoring unreadable settings cache %s: %s", SETTINGS_CACHE_FILE, e)
+        return None
+    if stored_key != list(cache_key) or not isinstance(settings, dict):
+        return None
+    return settings
+
+def save_cached_settings(cache_key, settings):
+    """Atomically writes the settings and their key to the settings cache."""
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=LOG_DIR, suffix='.tmp')
+    except OSError as e:
+        logging.warning("Could not write settings cache %s: %s", SETTINGS_CACHE_FILE, e)
+        return
+
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as file:
+            json.dump({"key": list(cache_key), "settings": settings}, file)
+        os.replace(tmp_path, SETTINGS_CACHE_FILE)
+    except (OSError, TypeError, ValueError) as e:
+        logging.warning("Could not write settings cache %s: %s", SETTINGS_CACHE_FILE, e)
+        # Do not leave the partially written temporary file behind in the log directory
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
 
 def read_settings(json_file):
-    """Reads settings from a JSON file and applies defaults."""
+    """Reads settings from a JSON file and applies defaults, reusing the cache when unchanged."""
     try:
-        with open(json_file, 'r', encoding='utf-8') as file:
-            settings = json.load(file)
+        file_stat = os.stat(json_file)
+        cache_key = (os.path.abspath(json_file), file_stat.st_mtime_ns, file_stat.st_size)
+        settings = load_cached_settings(cache_key)
+        if settings is None:
+            with open(json_file, 'rb') as file:
+                settings = settings_parser.loads(file.read())
+            save_cached_settings(cache_key, settings)
     except FileNotFoundError:
         logging.error("JSON file not found: %s", json_file)
         sys.exit(1)
@@ -72,14 +188,71 @@ def read_settings(json_file):
         "netCDF4", "cdflib", "astropy", "ipython",
         "jupyter", "h5py", "sgp4", "spacepy", "hapiclient"
     ])
+    settings.setdefault("lockfile", None)
     return settings
 
 
-def create_mamba_env(env_name):
-    """Creates a Conda environment using Mamba."""
+@functools.lru_cache(maxsize=None)
+def list_env_prefixes():
+    """Returns the prefixes of the existing Conda environments, querying Mamba only once."""
     try:
-        logging.info("Creating Conda environment: %s", env_name)
-        subprocess.check_call(["mamba", "create", "-n", env_name, "python=3.7", "-y"])
+        result = subprocess.check_output([MGR, "env", "list", "--json"], env=SUBENV)
+        return tuple(json.loads(result).get("envs", []))
+    except subprocess.CalledProcessError as e:
+        logging.warning("Subprocess error while listing Conda environments: %s", e)
+    except FileNotFoundError as e:
+        logging.warning("Micromamba or Mamba was not found while listing environments: %s", e)
+    except json.JSONDecodeError as e:
+        logging.warning("Failed to decode JSON output from 'env list': %s", e)
+    return ()
+
+def env_prefix(env_name):
+    """Returns the prefix of the named Conda environment, or None if it does not exist."""
+    for prefix in list_env_prefixes():
+        # Named environments live in `<root>/envs/<name>`; the package manager root
+        # prefix is also listed but is not a named environment
+        if (os.path.basename(prefix) == env_name
+                and os.path.basename(os.path.dirname(prefix)) == "envs"):
+            return prefix
+    return None
+
+def env_exists(env_name):
+    """Check if a Conda environment with the given name exists."""
+    return env_prefix(env_name) is not None
+
+def solver_flags(offline=False, frozen=False):
+    """Returns the extra Mamba flags for the `--offline` and `--frozen` options."""
+    return (["--offline"] if offline else []) + (["--no-deps"] if frozen else [])
+
+def with_ipykernel(packages):
+    """Returns the package list with `ipykernel` appended if it is missing."""
+    return packages + [pkg for pkg in ["ipykernel"] if pkg not in packages]
+
+# Python version of the environment, pinned on both creation and update
+PYTHON_SPEC = "python=3.7"
+
+def package_arguments(packages, lockfile=None):
+    """
+    Returns the Mamba arguments selecting what to install: the lockfile if one is given,
+    otherwise the Python version pin and the package list (plus `ipykernel`) from conda-forge.
+
+    A lockfile is an `@EXPLICIT` file of package URLs and hashes, so Mamba skips the solve.
+    It must include `python` and `ipykernel` itself.
+    """
+    if lockfile:
+        return ["--file", lockfile]
+    return ["-c", "conda-forge", PYTHON_SPEC] + with_ipykernel(packages)
+
+def create_env_with_packages(env_name, packages, offline=False, lockfile=None):
+    """Creates a Conda environment and installs packages in a single Mamba solve."""
+    env_packages = package_arguments(packages, lockfile)
+    try:
+        logging.info("Creating Conda environment %s with: %s",
+                     env_name, " ".join(env_packages))
+        run_command([MGR,
+                     "create",
+                     "-n",
+                     env_name] + env_packages + solver_flags(offline) + ["-y"])
         logging.info("Conda environment %s created successfully.", env_name)
     except subprocess.CalledProcessError as e:
         logging.error(
@@ -88,64 +261,109 @@ def create_mamba_env(env_name):
         sys.exit(1)
     except FileNotFoundError:
         logging.error(
-            "Mamba is not installed or not found in PATH. Please install Mamba and try again."
+            "Micromamba or Mamba is not installed or not found in PATH. "
+            "Please install one of them and try again."
         )
         sys.exit(1)
     except OSError as e:
         logging.error("An OS error occurred while creating Conda environment %s: %s", env_name, e)
         sys.exit(1)
 
-def install_packages(env_name, packages):
-    """Installs packages in the Conda environment using Mamba."""
+def update_env_packages(env_name, packages, offline=False, frozen=False, lockfile=None):
+    """Installs or updates packages in an existing Conda environment using Mamba."""
+    env_packages = package_arguments(packages, lockfile)
     try:
-        subprocess.check_call(["mamba",
-                               "install",
-                               "-n",
-                               env_name,
-                               "-c",
-                               "conda-forge"] + packages + ["-y"])
-        logging.info("Packages installed successfully in environment %s.", env_name)
+        logging.info("Conda environment %s already exists. Updating with: %s",
+                     env_name, " ".join(env_packages))
+        run_command([MGR,
+                     "install",
+                     "-n",
+                     env_name] + env_packages + solver_flags(offline, frozen) + ["-y"])
+        logging.info("Packages updated successfully in environment %s.", env_name)
     except subprocess.CalledProcessError as e:
         logging.error(
-            "Mamba command failed with exit code %s while installing packages in environment %s.",
+            "Mamba command failed with exit code %s while updating packages in environment %s.",
             e.returncode, env_name)
         sys.exit(1)
     except FileNotFoundError:
         logging.error(
-            "Mamba is not installed or not found in PATH. Please install Mamba and try again."
+            "Micromamba or Mamba is not installed or not found in PATH. "
+            "Please install one of them and try again."
         )
         sys.exit(1)
     except OSError as e:
         logging.error(
-            "An OS error occurred while installing packages in environment %s: %s",
-                      env_name, e)
+            "An OS error occurred while updating packages in environment %s: %s",
+            env_name, e)
         sys.exit(1)
 
-def install_kamodo_ccmc(env_name):
-    """Clones and installs the kamodo_ccmc package."""
-    git_executable = shutil.which("git")
-    if not git_executable:
+def require_executables(executables):
+    """Exits if any of the given executables (a mapping of name to resolved path) is missing."""
+    missing = [name for name, path in executables.items() if not path]
+    if missing:
         logging.error(
-            "Git is not installed or not found in PATH. Please install Git and try again."
-        )
+            "Required executables not found in PATH: %s. Please install them and try again.",
+            ", ".join(missing))
         sys.exit(1)
 
+def handle_remove_error(func, path, exc_info):
+    """
+    Error handler for `shutil.rmtree`: ignores paths that no longer exist and retries
+    read-only files (e.g. Git pack files on Windows) after making them writable.
+    Any other error is re-raised.
+    """
+    if issubclass(exc_info[0], FileNotFoundError):
+        return
+    if func in (os.unlink, os.remove, os.rmdir) and issubclass(exc_info[0], PermissionError):
+        os.chmod(path, stat.S_IWRITE | stat.S_IREAD)
+        func(path)
+        return
+    raise exc_info[1]
+
+def remove_clone_dir(clone_dir):
+    """Removes a cloned repository directory, or only the link if it is a symlink."""
+    if os.path.islink(clone_dir):
+        os.unlink(clone_dir)
+    else:
+        shutil.rmtree(clone_dir, onerror=handle_remove_error)
+
+def clone_kamodo(clone_dir="Kamodo"):
+    """Clones the Kamodo repository into the given directory."""
     repo_url = "https://github.com/nasa/Kamodo.git"
-    clone_dir = "Kamodo"
 
     try:
-        if os.path.exists(clone_dir):
-            logging.info("Directory %s already exists. Deleting it to proceed.", clone_dir)
-            shutil.rmtree(clone_dir)
+        # Remove any previous (possibly partially deleted) clone
+        remove_clone_dir(clone_dir)
 
         logging.info("Cloning the Kamodo repository...")
-        subprocess.check_call([git_executable, "clone", repo_url, clone_dir])
+        # Only the current tree is needed, so skip the history and fetch blobs lazily.
+        # Progress output and the automatic gc are of no use here; stderr is kept for errors.
+        subprocess.run([
+            GIT, "-c", "gc.auto=0", "clone", "--quiet", "--depth", "1", "--filter=blob:none",
+            "--single-branch", repo_url, clone_dir
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, env=SUBENV, check=True)
         logging.info("Repository cloned successfully.")
+    except subprocess.CalledProcessError as e:
+        logging.error("Git clone failed with exit code %s: %s", e.returncode,
+                      e.stderr.decode(errors='replace').strip())
+        sys.exit(1)
+    except FileNotFoundError as e:
+        logging.error("Required executable not found: %s", e)
+        sys.exit(1)
+    except PermissionError as e:
+        logging.error("Permission error occurred: %s", e)
+        sys.exit(1)
+    except OSError as e:
+        logging.error("An OS error occurred: %s", e)
+        sys.exit(1)
 
-        # Install Kamodo
-        logging.info("Installing Kamodo...")
-        subprocess.check_call([
-            "conda", "run", "-n", env_name, "pip", "install", "Kamodo"
+def pip_install_kamodo(env_name, clone_dir="Kamodo"):
+    """Installs Kamodo into the Conda environment using pip from the cloned repository."""
+    try:
+        logging.info("Installing Kamodo from %s...", clone_dir)
+        run_command([
+            MGR, "run", "-n", env_name, "pip", "install", "--no-build-isolation",
+            os.path.abspath(clone_dir)
         ])
         logging.info("Kamodo installed successfully in %s.", env_name)
     except subprocess.CalledProcessError as e:
@@ -162,11 +380,14 @@ def install_kamodo_ccmc(env_name):
         sys.exit(1)
 
 def enable_jupyter_kernel(env_name):
-    """Adds the Conda environment as a Jupyter kernel."""
+    """
+    Adds the Conda environment as a Jupyter kernel.
+
+    `ipykernel` is installed by the initial environment solve (see `with_ipykernel`).
+    """
     try:
-        subprocess.check_call(["mamba", "install", "-n", env_name, "ipykernel", "-y"])
-        subprocess.check_call([
-            "conda", "run", "-n", env_name,
+        run_command([
+            MGR, "run", "-n", env_name,
             "python", "-m", "ipykernel", "install",
             "--user", "--name", env_name,
             "--display-name", f"Python ({env_name})"
@@ -180,7 +401,7 @@ def enable_jupyter_kernel(env_name):
         sys.exit(1)
     except FileNotFoundError:
         logging.error(
-            "Required executable not found. Ensure that Mamba, Conda, and Python are in PATH."
+            "Required executable not found. Ensure that Micromamba or Mamba is in PATH."
         )
         sys.exit(1)
     except PermissionError as e:
@@ -196,8 +417,12 @@ def enable_jupyter_kernel(env_name):
 
 def kernel_exists(kernel_name):
     """Check if a Jupyter kernel spec exists."""
+    if not JUPYTER:
+        logging.warning("The 'jupyter' command was not found in PATH.")
+        return False
     try:
-        result = subprocess.check_output(["jupyter", "kernelspec", "list", "--json"])
+        result = subprocess.check_output([JUPYTER, "kernelspec", "list", "--json"],
+                                         env=SUBENV)
         kernel_specs = json.loads(result).get("kernelspecs", {})
         return kernel_name in kernel_specs
     except subprocess.CalledProcessError as e:
@@ -213,8 +438,8 @@ def tear_down_env(env_name):
     try:
         # Check if the kernel exists before attempting to remove it
         if kernel_exists(env_name):
-            subprocess.check_call([
-                "jupyter", "kernelspec", "remove", env_name, "-f"
+            run_command([
+                JUPYTER, "kernelspec", "remove", env_name, "-f"
             ])
             logging.info("Jupyter kernel for environment '%s' has been removed.", env_name)
         else:
@@ -229,14 +454,16 @@ def tear_down_env(env_name):
 
     try:
         # Remove the Conda environment
-        subprocess.check_call(["conda", "env", "remove", "-n", env_name, "-y"])
+        run_command([MGR, "env", "remove", "-n", env_name, "-y"])
         logging.info("Conda environment '%s' has been removed.", env_name)
     except subprocess.CalledProcessError as e:
-        logging.error("Failed to remove Conda environment '%s'. Process error: %s", env_name, e)
-        sys.exit(1)
+        logging.warning(
+            "Failed to remove Conda environment '%s' (exit code %s). "
+            "Deleting the environment directory instead.", env_name, e.returncode)
+        remove_env_prefix(env_name)
     except FileNotFoundError as e:
         logging.error(
-            "The 'conda' command was not found. Ensure Conda is installed and in PATH. Error: %s",
+            "Micromamba or Mamba was not found. Ensure one is installed and in PATH. Error: %s",
             e
         )
         sys.exit(1)
@@ -252,11 +479,27 @@ def tear_down_env(env_name):
         logging.error("OS error occurred while cleaning cloned repository: %s", e)
 
 
+def remove_env_prefix(env_name):
+    """Deletes the directory of a Conda environment without going through the package manager."""
+    prefix = env_prefix(env_name)
+    if not prefix:
+        logging.error("Could not find the directory of Conda environment '%s'.", env_name)
+        sys.exit(1)
+
+    try:
+        shutil.rmtree(prefix, onerror=handle_remove_error)
+        logging.info("Conda environment directory '%s' has been removed.", prefix)
+    except OSError as e:
+        logging.error("OS error occurred while removing Conda environment directory '%s': %s",
+                      prefix,
+                      e)
+        sys.exit(1)
+
 def clean_cloned_repository(clone_dir):
     """Removes the cloned repository directory."""
     try:
-        if os.path.exists(clone_dir):
-            shutil.rmtree(clone_dir)
+        if os.path.lexists(clone_dir):
+            remove_clone_dir(clone_dir)
             logging.info("Cloned repository '%s' has been successfully removed.",
                          clone_dir)
         else:
@@ -275,52 +518,100 @@ def clean_cloned_repository(clone_dir):
                       clone_dir,
                       e)
 
+def parse_arguments():
+    """Parses the command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Set up or remove a Conda environment for the Kamodo framework.")
+    parser.add_argument("--clean", action="store_true",
+                        help="remove the Conda environment, its Jupyter kernel and the clone")
+    parser.add_argument("--offline", action="store_true",
+                        help="install from the local package cache without downloading repodata")
+    parser.add_argument("--frozen", action="store_true",
+                        help="update an existing environment without resolving dependencies")
+    return parser.parse_args()
+
 def main():
     """
     Main function for setting up or cleaning up a Conda environment for the Kamodo installer.
 
-    This function reads user settings from a JSON file, creates a Conda environment using Mamba,
-    installs required packages, installs Kamodo, and enables the Jupyter kernel for the environment.
+    This function reads user settings from a JSON file, creates a Conda environment with the
+    required packages using Mamba, installs Kamodo, and enables the Jupyter kernel for the
+    environment.
     It also provides an option to clean up (tear down) the environment if specified via a 
     command-line argument.
 
     Workflow:
     1. Reads settings from a JSON file (`oss_kamodo_installer_settings.json`).
-    2. Checks for the `--clean` flag in command-line arguments to tear down the environment.
-    3. Creates the Conda environment if the `--clean` flag is not set.
-    4. Installs required packages in the environment.
-    5. Installs Kamodo from its repository.
-    6. Enables the Jupyter kernel for the environment.
+    2. Parses the command-line arguments and tears down the environment if `--clean` is set.
+    3. Creates the Conda environment with the required packages (including `ipykernel`)
+       in a single Mamba solve, or from the `lockfile` setting without a solve, if the
+       `--clean` flag is not set, while cloning the Kamodo repository in parallel.
+       An existing environment is updated instead.
+    4. Installs Kamodo into the environment from the cloned repository.
+    5. Enables the Jupyter kernel for the environment.
 
     Command-line Arguments:
         --clean : Optional argument to remove the specified Conda environment.
+        --offline : Optional argument to pass `--offline` to Mamba (no repodata download).
+        --frozen : Optional argument to pass `--no-deps` to Mamba (no dependency solving)
+                   when updating an existing environment; ignored on creation.
 
     Note:
-        Ensure that the required utilities (`mamba`, `conda`, `Kamodo`) are available
+        Ensure that the required utilities (`micromamba` or `mamba`, `git`) are available
         in the system's PATH.
 
     """
+    args = parse_arguments()
+
     settings_file = "oss_kamodo_installer_settings.json"  # JSON file containing user settings
     settings = read_settings(settings_file)
 
     env_name = settings["env_name"]
     packages = settings["packages"]
+    lockfile = settings.get("lockfile")
 
     # Option to tear down the environment
-    if "--clean" in sys.argv:
+    if args.clean:
+        require_executables({"micromamba or mamba": MGR})
         tear_down_env(env_name)
         return
 
-    # Step 1: Create the Conda environment using Mamba
-    create_mamba_env(env_name)
-
-    # Step 2: Install required packages
-    install_packages(env_name, packages)
-
-    # Step 3: Clone and install Kamodo
-    install_kamodo_ccmc(env_name)
-
-    # Step 4: Enable the Jupyter kernel for the environment
+    require_executables({"micromamba or mamba": MGR, "git": GIT})
+
+    # Step 1: Create the Conda environment and install required packages using Mamba,
+    # or only update the packages if the environment already exists.
+    # The Kamodo clone does not depend on the environment, so it runs concurrently.
+    # A running step cannot be interrupted: if one step fails, the script still waits for
+    # the other one to finish before exiting.
+    if env_exists(env_name):
+        env_step = functools.partial(update_env_packages, frozen=args.frozen)
+    else:
+        # `--no-deps` on a fresh environment would leave out Python's own dependencies
+        # and pip, so `--frozen` only applies to an existing environment
+        if args.frozen:
+            logging.warning("Conda environment %s does not exist yet; ignoring --frozen.",
+                            env_name)
+        env_step = create_env_with_packages
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        steps = [
+            executor.submit(env_step, env_name, packages,
+                            offline=args.offline, lockfile=lockfile),
+            executor.submit(clone_kamodo)
+        ]
+        for step in as_completed(steps):
+            try:
+                # Re-raises the SystemExit of a failed step in the main thread
+                step.result()
+            except SystemExit:
+                if not all(other.done() for other in steps):
+                    logging.error("An installation step failed. Waiting for the remaining "
+                                  "step to finish before exiting...")
+                raise
+
+    # Step 2: Install Kamodo
+    pip_install_kamodo(env_name)
+
+    # Step 3: Enable the Jupyter kernel for the environment
     enable_jupyter_kernel(env_name)
 
 if __name__ == "__main__":